@@ -93,11 +93,17 @@ pub fn build(b: *std.Build) void {
     // Build the list of Python include dirs for cross-compilation.
     // These are passed to the PyOZ dependency so its @cImport("Python.h") finds
     // the correct headers instead of the host Python's.
-    // Note: build_wheels.py stages the correct pyconfig.h (unix or windows)
-    // directly into the headers directory before each build.
+    // pyconfig.h is not in the headers directory itself: the platform-specific
+    // subdirectory (unix or windows) comes second on the include path, and
+    // Python.h's #include "pyconfig.h" falls back to it. This lets every target
+    // share one headers directory, so builds can run concurrently.
     const target_os = target.result.os.tag;
+    const pyconfig_subdir = if (target_os == .windows) "windows" else "unix";
     const cross_include_dirs: ?[]const []const u8 = if (python_headers_dir) |headers_dir|
-        b.allocator.dupe([]const u8, &.{headers_dir}) catch @panic("OOM")
+        b.allocator.dupe([]const u8, &.{
+            headers_dir,
+            std.fmt.allocPrint(b.allocator, "{s}/{s}", .{ headers_dir, pyconfig_subdir }) catch @panic("OOM"),
+        }) catch @panic("OOM")
     else
         null;
 
@@ -165,10 +171,12 @@ pub fn build(b: *std.Build) void {
     // On Windows, link against python3.dll (the version-agnostic stable ABI DLL)
     // instead of python3XX.dll, so the extension works across all Python 3.x.
     if (python_headers_dir) |headers_dir| {
-        // Cross-compilation: use downloaded CPython headers.
-        // build_wheels.py stages the correct pyconfig.h into this directory.
-        lib.addIncludePath(.{ .cwd_relative = headers_dir });
-        lib.root_module.addIncludePath(.{ .cwd_relative = headers_dir });
+        // Cross-compilation: use downloaded CPython headers, plus the
+        // platform's pyconfig.h directory (see cross_include_dirs above).
+        for (cross_include_dirs.?) |dir| {
+            lib.addIncludePath(.{ .cwd_relative = dir });
+            lib.root_module.addIncludePath(.{ .cwd_relative = dir });
+        }
 
         if (target_os == .windows) {
             // Generate python3.lib import library from python3.def using zig dlltool.
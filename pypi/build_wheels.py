@@ -8,31 +8,93 @@ Usage:
     # Build wheels for all platforms (cross-compile)
     python build_wheels.py
 
+    # Cross-compile without reusing cached builds
+    python build_wheels.py --no-cache
+
+Downloads and builds are cached under ~/.cache/pyoz/ (delete it to clear):
+    cpython-<version>.tgz  CPython source tarball the headers come from
+    builds/<key>/          cross-compiled extensions, keyed by a hash of the
+                           zig version, build files, sources and headers;
+                           only the latest key is kept
+
 The extension is built with 'zig build' in the pypi/ directory, producing
 a _pyoz.so/.pyd native module that exposes the CLI as a Python library.
 """
 
 import argparse
+import base64
+import concurrent.futures
+import functools
 import hashlib
-import io
 import os
 import platform as plat
 import re
 import shutil
+import struct
 import subprocess
 import sys
 import tarfile
+import threading
+import time
+import urllib.error
 import urllib.request
 import zipfile
 
-# Map from (os, arch) to (zig target, wheel platform tag, extension)
+# Directory containing this script (and build.zig, pyproject.toml, pyoz/)
+PYPI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Prefer an accelerated DEFLATE implementation when one is installed. zipfile
+# looks up its compressor through the module-level `zlib` global, and both
+# backends are drop-in replacements producing standard DEFLATE streams.
+try:
+    from isal import isal_zlib as _fast_zlib
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as _fast_zlib
+    except ImportError:
+        _fast_zlib = None
+if _fast_zlib is not None:
+    zipfile.zlib = _fast_zlib
+
+# DEFLATE levels, in the selected backend's own scale (isal only has 0-3).
+# Text members are tiny, so they get the best ratio; the native extension is
+# large and only partly compressible, so it gets the fastest level, which
+# keeps most of the size win at a fraction of the time.
+TEXT_COMPRESSLEVEL = zipfile.zlib.Z_BEST_COMPRESSION
+EXTENSION_COMPRESSLEVEL = zipfile.zlib.Z_BEST_SPEED
+
+# TOML parser: stdlib on Python 3.11+, tomli on older interpreters, or None
+try:
+    import tomllib as _tomllib
+except ImportError:
+    try:
+        import tomli as _tomllib
+    except ImportError:
+        _tomllib = None
+
+# Optional: lets the default --jobs take available memory into account
+try:
+    import psutil as _psutil
+except ImportError:
+    _psutil = None
+
+# Chunk size for streaming copies (extension into wheel, headers out of tarball)
+COPY_CHUNK_SIZE = 1 << 20
+
+# Pure-Python modules of the pyoz package shipped alongside the extension
+PACKAGE_MODULES = ("__init__.py", "__main__.py", "backend.py")
+
+# Map from (os, arch) to (zig target, wheel platform tag, extension, zig cpu).
+# The cpu is the oldest model each platform's wheels must run on. Platform tags
+# say nothing about CPU features, so this is zig's baseline everywhere except
+# arm64 macOS, where every machine has at least an Apple M1.
 TARGETS = [
-    ("x86_64-linux-gnu", "manylinux2014_x86_64", ".so"),
-    ("aarch64-linux-gnu", "manylinux2014_aarch64", ".so"),
-    ("x86_64-macos", "macosx_11_0_x86_64", ".so"),
-    ("aarch64-macos", "macosx_11_0_arm64", ".so"),
-    ("x86_64-windows", "win_amd64", ".pyd"),
-    ("aarch64-windows", "win_arm64", ".pyd"),
+    ("x86_64-linux-gnu", "manylinux2014_x86_64", ".so", "baseline"),
+    ("aarch64-linux-gnu", "manylinux2014_aarch64", ".so", "baseline"),
+    ("x86_64-macos", "macosx_11_0_x86_64", ".so", "baseline"),
+    ("aarch64-macos", "macosx_11_0_arm64", ".so", "apple_m1"),
+    ("x86_64-windows", "win_amd64", ".pyd", "baseline"),
+    ("aarch64-windows", "win_arm64", ".pyd", "baseline"),
 ]
 
 
@@ -41,62 +103,190 @@ CPYTHON_VERSION = "3.13.1"
 CPYTHON_URL = (
     f"https://www.python.org/ftp/python/{CPYTHON_VERSION}/Python-{CPYTHON_VERSION}.tgz"
 )
+# Published SHA-256 of the tarball above; update together with CPYTHON_VERSION
+CPYTHON_SHA256 = "1513925a9f255ef0793dbf2f78bb4533c9f184bdd0ad19763fd7f47a400a7c55"
+
+# Number of concurrent HTTP Range requests used to download the tarball
+DOWNLOAD_PARTS = 8
+
+# Per-user cache for downloads and builds, kept out of the source tree
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pyoz")
+
+# Cross-compiled extensions are cached here, keyed by build_cache_key(). Only
+# the most recent key is kept (see prune_build_cache()).
+BUILD_CACHE_DIR = os.path.join(CACHE_DIR, "builds")
+
+# Approximate peak memory of one cross-compiling zig build (LLVM codegen)
+BUILD_MEMORY_PER_JOB = 2 << 30
+
+
+class _RangeNotSupported(Exception):
+    """The server answered a Range request with the full body."""
 
 
-def _generate_python3_def(headers_dir, toml_content):
+def _download(url, path, parts=DOWNLOAD_PARTS):
+    """Download url to path, fetching it as parallel byte ranges when possible.
+
+    Several concurrent streams fill the link much better than one on
+    high-latency connections. The file is sized up front and each range is
+    written straight to its offset through its own file handle, so memory
+    use stays bounded. If the server does not advertise range support, the
+    body is streamed in a single request instead.
+    """
+    headers = {"Accept-Encoding": "identity"}
+    try:
+        head = urllib.request.Request(url, headers=headers, method="HEAD")
+        with urllib.request.urlopen(head) as resp:
+            total = int(resp.headers.get("Content-Length") or 0)
+            ranges = resp.headers.get("Accept-Ranges", "").lower() == "bytes"
+    except (urllib.error.URLError, ValueError):
+        total, ranges = 0, False
+
+    def stream():
+        req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(req) as src, open(path, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+    if not ranges or total < parts:
+        stream()
+        return
+
+    with open(path, "wb") as f:
+        f.truncate(total)
+    step = -(-total // parts)
+
+    def fetch(start):
+        end = min(start + step, total)
+        req = urllib.request.Request(
+            url, headers={**headers, "Range": f"bytes={start}-{end - 1}"}
+        )
+        with urllib.request.urlopen(req) as resp, open(path, "r+b") as dst:
+            if resp.status != 206:
+                raise _RangeNotSupported(url)
+            dst.seek(start)
+            remaining = end - start
+            while remaining:
+                chunk = resp.read(min(COPY_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise urllib.error.URLError(f"short read for range {start}-{end}")
+                dst.write(chunk)
+                remaining -= len(chunk)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=parts) as pool:
+            list(pool.map(fetch, range(0, total, step)))
+    except _RangeNotSupported:
+        stream()
+        return
+
+    print(f"  Downloaded {total // (1024 * 1024)}MB in {parts} parts")
+
+
+def _generate_python3_def(headers_dir, toml_file):
     """Generate python3.def from stable_abi.toml for Windows import library.
 
     The .def file lists all symbols exported by python3.dll (the Stable ABI DLL).
     This is used by `zig dlltool` to generate python3.lib for cross-compilation.
+    toml_file is a binary file object, such as a tar member.
     """
-    try:
-        import tomllib
-    except ImportError:
-        try:
-            import tomli as tomllib
-        except ImportError:
-            print(
-                "  Warning: no TOML parser available, skipping python3.def generation"
-            )
-            return
+    if _tomllib is None:
+        print("  Warning: no TOML parser available, skipping python3.def generation")
+        return
 
-    data = tomllib.loads(toml_content)
-    functions = []
-    datas = []
+    data = _tomllib.load(toml_file)
 
-    for category, entries in data.items():
+    # Only the "function" and "data" tables name exported symbols
+    def symbols(category):
+        entries = data.get(category)
         if not isinstance(entries, dict):
-            continue
-        for name, info in entries.items():
-            if not isinstance(info, dict):
-                continue
-            if category == "function":
-                functions.append(name)
-            elif category == "data":
-                datas.append(name)
+            return []
+        return sorted(name for name, info in entries.items() if isinstance(info, dict))
 
+    functions = symbols("function")
+    datas = symbols("data")
+
+    body = (
+        "LIBRARY python3\nEXPORTS\n"
+        + "".join(f"    {name}\n" for name in functions)
+        + "".join(f"    {name} DATA\n" for name in datas)
+    )
     def_path = os.path.join(headers_dir, "windows", "python3.def")
     with open(def_path, "w") as f:
-        f.write("LIBRARY python3\n")
-        f.write("EXPORTS\n")
-        for name in sorted(functions):
-            f.write(f"    {name}\n")
-        for name in sorted(datas):
-            f.write(f"    {name} DATA\n")
+        f.write(body)
 
     print(
         f"  Generated python3.def ({len(functions)} functions, {len(datas)} data symbols)"
     )
 
 
+def _copy_and_hash(src, dst=None):
+    """Read src in COPY_CHUNK_SIZE chunks, writing them to dst if given.
+
+    Hashing and writing share one preallocated buffer filled with readinto(),
+    so a single pass over the data does both with no per-chunk allocation.
+    Returns (sha256 hash object, number of bytes read).
+    """
+    h = hashlib.sha256()
+    size = 0
+    buf = bytearray(COPY_CHUNK_SIZE)
+    with memoryview(buf) as view:
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            chunk = view[:n]
+            if dst is not None:
+                dst.write(chunk)
+            h.update(chunk)
+            size += n
+    return h, size
+
+
+def _file_sha256(path):
+    """Return the hex SHA-256 of a file, or None if it does not exist."""
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h, _ = _copy_and_hash(f)
+    return h.hexdigest()
+
+
+def _download_tarball(dest):
+    """Download the CPython tarball to dest, verifying it against CPYTHON_SHA256."""
+    print(f"  Downloading {CPYTHON_URL}...")
+    partial = dest + ".part"
+    _download(CPYTHON_URL, partial)
+    digest = _file_sha256(partial)
+    if digest != CPYTHON_SHA256:
+        os.remove(partial)
+        raise RuntimeError(
+            f"SHA-256 mismatch for {CPYTHON_URL}: "
+            f"expected {CPYTHON_SHA256}, got {digest}"
+        )
+    os.replace(partial, dest)
+
+
 def ensure_python_headers(headers_dir):
     """Download CPython headers for cross-compilation if not already cached.
 
-    Downloads the CPython source tarball and extracts:
+    The source tarball is kept in CACHE_DIR as cpython-<version>.tgz, so
+    re-extracting (e.g. after deleting headers_dir) does not download it
+    again. It is checked against CPYTHON_SHA256 before use.
+
+    Extracts from the CPython source tarball:
     - Include/*.h and Include/cpython/*.h → headers_dir/ (platform-independent)
     - PC/pyconfig.h → headers_dir/windows/pyconfig.h (Windows-specific)
     - Host pyconfig.h → headers_dir/unix/pyconfig.h (for Linux/macOS cross-targets)
     """
+    # pyconfig.h is picked per platform from unix/ or windows/ (see
+    # pypi/build.zig). Remove a copy staged at the top level by older versions
+    # of this script: it would shadow the platform-specific one.
+    stale_pyconfig = os.path.join(headers_dir, "pyconfig.h")
+    if os.path.exists(stale_pyconfig):
+        os.remove(stale_pyconfig)
+
     marker = os.path.join(headers_dir, ".cpython-version")
     if os.path.exists(marker):
         with open(marker) as f:
@@ -106,7 +296,7 @@ def ensure_python_headers(headers_dir):
                 )
                 return
 
-    print(f"  Downloading CPython {CPYTHON_VERSION} headers...")
+    print(f"  Extracting CPython {CPYTHON_VERSION} headers...")
 
     # Clean previous headers
     if os.path.exists(headers_dir):
@@ -116,11 +306,6 @@ def ensure_python_headers(headers_dir):
     os.makedirs(os.path.join(headers_dir, "windows"), exist_ok=True)
     os.makedirs(os.path.join(headers_dir, "unix"), exist_ok=True)
 
-    # Download and extract
-    resp = urllib.request.urlopen(CPYTHON_URL)
-    data = resp.read()
-    print(f"  Downloaded {len(data) // (1024 * 1024)}MB")
-
     prefix = f"Python-{CPYTHON_VERSION}/"
     include_prefix = prefix + "Include/"
     # Windows pyconfig.h is named pyconfig.h.in in the source tree but is a
@@ -128,40 +313,54 @@ def ensure_python_headers(headers_dir):
     pc_pyconfig = prefix + "PC/pyconfig.h.in"
     stable_abi_toml = prefix + "Misc/stable_abi.toml"
 
-    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
-        for member in tar.getmembers():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tarball = os.path.join(CACHE_DIR, f"cpython-{CPYTHON_VERSION}.tgz")
+    if _file_sha256(tarball) == CPYTHON_SHA256:
+        print(f"  Using cached tarball {tarball}")
+    else:
+        _download_tarball(tarball)
+
+    # Iterating the archive reads members lazily in a single forward pass
+    with tarfile.open(tarball, mode="r:gz") as tar:
+        for member in tar:
+            # Most of the ~4000 members are sources, tests and docs; reject
+            # them by name before looking at anything else
+            name = member.name
+            if not (
+                name.startswith(include_prefix)
+                or name == pc_pyconfig
+                or name == stable_abi_toml
+            ):
+                continue
             if not member.isfile():
                 continue
 
             # Extract Include/ headers (platform-independent)
-            if member.name.startswith(include_prefix):
-                rel = member.name[len(include_prefix) :]
+            if name.startswith(include_prefix):
+                rel = name[len(include_prefix) :]
                 if not rel:
                     continue
                 dest = os.path.join(headers_dir, rel)
                 os.makedirs(os.path.dirname(dest), exist_ok=True)
                 src = tar.extractfile(member)
                 if src is not None:
-                    with open(dest, "wb") as dst:
-                        dst.write(src.read())
-                    src.close()
+                    with src, open(dest, "wb") as dst:
+                        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
 
             # Extract PC/pyconfig.h for Windows
-            elif member.name == pc_pyconfig:
+            elif name == pc_pyconfig:
                 dest = os.path.join(headers_dir, "windows", "pyconfig.h")
                 src = tar.extractfile(member)
                 if src is not None:
-                    with open(dest, "wb") as dst:
-                        dst.write(src.read())
-                    src.close()
+                    with src, open(dest, "wb") as dst:
+                        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
 
             # Extract stable_abi.toml for generating python3.def
-            elif member.name == stable_abi_toml:
+            elif name == stable_abi_toml:
                 src = tar.extractfile(member)
                 if src is not None:
-                    toml_content = src.read().decode()
-                    src.close()
-                    _generate_python3_def(headers_dir, toml_content)
+                    with src:
+                        _generate_python3_def(headers_dir, src)
 
     # Copy host pyconfig.h for Unix cross-targets (Linux→macOS works because
     # both are LP64 with identical SIZEOF_* values: SIZEOF_LONG=8, SIZEOF_WCHAR_T=4)
@@ -213,8 +412,6 @@ def _find_host_pyconfig():
     except (subprocess.CalledProcessError, FileNotFoundError):
         pass
     # Fallback: try multiarch-specific locations (Debian/Ubuntu layout)
-    import struct
-
     arch = "x86_64" if struct.calcsize("P") == 8 else "i386"
     for ver in ["3.13", "3.12", "3.11", "3.10"]:
         path = f"/usr/include/{arch}-linux-gnu/python{ver}/pyconfig.h"
@@ -223,27 +420,18 @@ def _find_host_pyconfig():
     return None
 
 
-def stage_pyconfig(headers_dir, zig_target):
-    """Copy the correct platform-specific pyconfig.h into the headers directory.
-
-    Python.h does #include "pyconfig.h" with quotes, so it must be in the
-    same directory as Python.h for the compiler to find it.
-    """
-    if "windows" in zig_target:
-        src = os.path.join(headers_dir, "windows", "pyconfig.h")
-    else:
-        src = os.path.join(headers_dir, "unix", "pyconfig.h")
-
-    dst = os.path.join(headers_dir, "pyconfig.h")
-    if os.path.isfile(src):
-        shutil.copy2(src, dst)
-    else:
-        print(f"  Warning: pyconfig.h not found at {src}")
-
-
+@functools.lru_cache(maxsize=1)
 def get_version():
     """Read version from pyproject.toml."""
-    pyproject = os.path.join(os.path.dirname(__file__), "pyproject.toml")
+    pyproject = os.path.join(PYPI_DIR, "pyproject.toml")
+    if _tomllib is not None:
+        with open(pyproject, "rb") as f:
+            version = _tomllib.load(f).get("project", {}).get("version")
+        if version:
+            return version
+        raise RuntimeError("Could not find version in pyproject.toml")
+
+    # No TOML parser on this interpreter: fall back to a line scan
     with open(pyproject) as f:
         for line in f:
             m = re.match(r'^version\s*=\s*"(.+)"', line)
@@ -254,88 +442,130 @@ def get_version():
 
 def sha256_digest(data):
     """Compute SHA256 digest in urlsafe base64 (no padding)."""
-    import base64
+    return _encode_digest(hashlib.sha256(data).digest())
+
 
-    h = hashlib.sha256(data).digest()
-    return base64.urlsafe_b64encode(h).rstrip(b"=").decode("ascii")
+def _encode_digest(digest):
+    """Encode a raw digest in urlsafe base64 (no padding), as RECORD expects."""
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
 
 
+@functools.lru_cache(maxsize=1)
 def read_readme():
     """Read the README.md file for inclusion in wheel metadata."""
-    readme_path = os.path.join(os.path.dirname(__file__), "README.md")
+    readme_path = os.path.join(PYPI_DIR, "README.md")
     with open(readme_path, "r") as f:
         return f.read()
 
 
-def zig_build(target=None, release=True, python_headers_dir=None):
-    """Run zig build in the pypi/ directory, optionally cross-compiling."""
-    pypi_dir = os.path.dirname(os.path.abspath(__file__))
+def zig_build(
+    target=None,
+    release=True,
+    python_headers_dir=None,
+    prefix=None,
+    log_path=None,
+    cpu=None,
+):
+    """Run zig build in the pypi/ directory, optionally cross-compiling.
+
+    With log_path, zig's output goes to that file instead of the terminal,
+    so several builds can run at once without interleaving; the log is
+    printed if the build fails.
+    """
     cmd = ["zig", "build"]
+    if prefix:
+        cmd.extend(["-p", prefix])
     if release:
         cmd.append("-Doptimize=ReleaseFast")
     if target:
         cmd.extend([f"-Dtarget={target}"])
+    if cpu:
+        cmd.append(f"-Dcpu={cpu}")
     if python_headers_dir:
         cmd.append(f"-Dpython-headers-dir={python_headers_dir}")
     print(f"  Building: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=pypi_dir)
+    if log_path is None:
+        result = subprocess.run(cmd, cwd=PYPI_DIR)
+    else:
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        with open(log_path, "wb") as log:
+            result = subprocess.run(
+                cmd, cwd=PYPI_DIR, stdout=log, stderr=subprocess.STDOUT
+            )
     if result.returncode != 0:
         print(f"  Error: zig build failed for target {target or 'native'}")
+        if log_path is not None:
+            with open(log_path, errors="replace") as log:
+                print(log.read(), end="")
         return False
     return True
 
 
-def find_extension(ext=".so"):
-    """Find the built _pyoz extension in zig-out/lib/ or zig-out/bin/ (Windows)."""
-    pypi_dir = os.path.dirname(os.path.abspath(__file__))
-    # Zig puts shared libraries in lib/ on Unix but DLLs in bin/ on Windows
+def find_extension(ext=".so", prefix=None):
+    """Find the built _pyoz extension in <prefix>/lib/ or <prefix>/bin/ (Windows).
+
+    The prefix defaults to zig-out/, zig's default install prefix.
+    """
+    if prefix is None:
+        prefix = os.path.join(PYPI_DIR, "zig-out")
+    # Zig puts shared libraries in lib/ on Unix but DLLs in bin/ on Windows.
+    # scandir returns the file type with each entry, so no extra stat calls.
+    filename = f"_pyoz{ext}"
     for subdir in ("lib", "bin"):
-        path = os.path.join(pypi_dir, "zig-out", subdir, f"_pyoz{ext}")
-        if os.path.isfile(path):
-            return path
+        try:
+            with os.scandir(os.path.join(prefix, subdir)) as it:
+                for entry in it:
+                    if entry.name == filename and entry.is_file():
+                        return entry.path
+        except FileNotFoundError:
+            continue
     return None
 
 
-def build_wheel(extension_path, ext, platform_tag, version, dist_dir):
-    """Build a single platform-specific wheel containing the native extension.
+@functools.lru_cache(maxsize=None)
+def zip_date_time():
+    """Timestamp stored for every wheel member.
 
-    Uses abi3 (Python Stable ABI) tags: cp38-abi3-{platform}
-    This means a single wheel works for Python 3.8, 3.9, 3.10, 3.11, 3.12, 3.13+
+    Fixed (SOURCE_DATE_EPOCH when set, else the earliest date ZIP can
+    represent) so rebuilds are byte-identical. An empty SOURCE_DATE_EPOCH
+    counts as unset; any other non-integer value raises ValueError.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH") or "0"
+    try:
+        seconds = int(epoch)
+    except ValueError:
+        raise ValueError(
+            f"SOURCE_DATE_EPOCH must be an integer number of seconds, got {epoch!r}"
+        ) from None
+    return max(time.gmtime(seconds)[:6], (1980, 1, 1, 0, 0, 0))
+
+
+def _zip_info(name, compresslevel, mode=0o644):
+    """Create a deflated ZipInfo for a wheel member with a fixed timestamp."""
+    info = zipfile.ZipInfo(name, date_time=zip_date_time())
+    info.compress_type = zipfile.ZIP_DEFLATED
+    # ZipFile.open(info, "w") has no compresslevel argument; it reads the
+    # level from this attribute (still honoured on 3.13+, where it is an
+    # alias of ZipInfo.compress_level)
+    info._compresslevel = compresslevel
+    info.external_attr = mode << 16
+    return info
+
+
+def wheel_common_entries(version, readme_content=None):
+    """Build the wheel members that are the same on every platform.
+
+    Returns (archive name, data, RECORD line) tuples for the pyoz package
+    modules, METADATA, entry_points.txt and top_level.txt, so they are read
+    and hashed once and shared by all wheels; only WHEEL and RECORD differ
+    per platform. readme_content is the long description for METADATA
+    (read_readme() when omitted).
     """
-    wheel_name = f"pyoz-{version}-cp38-abi3-{platform_tag}.whl"
-    wheel_path = os.path.join(dist_dir, wheel_name)
-
     dist_info = f"pyoz-{version}.dist-info"
-    readme_content = read_readme()
-    pypi_dir = os.path.dirname(os.path.abspath(__file__))
-
-    with zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_DEFLATED) as whl:
-        # Add pyoz/__init__.py
-        init_path = os.path.join(pypi_dir, "pyoz", "__init__.py")
-        with open(init_path, "rb") as f:
-            whl.writestr("pyoz/__init__.py", f.read())
-
-        # Add pyoz/__main__.py
-        main_path = os.path.join(pypi_dir, "pyoz", "__main__.py")
-        with open(main_path, "rb") as f:
-            whl.writestr("pyoz/__main__.py", f.read())
-
-        # Add pyoz/backend.py (PEP 517 build backend)
-        backend_path = os.path.join(pypi_dir, "pyoz", "backend.py")
-        with open(backend_path, "rb") as f:
-            whl.writestr("pyoz/backend.py", f.read())
-
-        # Add the native extension module
-        with open(extension_path, "rb") as f:
-            ext_data = f.read()
-        ext_target = f"_pyoz{ext}"
-        info = zipfile.ZipInfo(ext_target)
-        info.external_attr = 0o755 << 16
-        info.compress_type = zipfile.ZIP_DEFLATED
-        whl.writestr(info, ext_data)
+    if readme_content is None:
+        readme_content = read_readme()
 
-        # METADATA
-        metadata = f"""Metadata-Version: 2.1
+    metadata = f"""Metadata-Version: 2.1
 Name: pyoz
 Version: {version}
 Summary: Python extension modules in Zig, made easy
@@ -354,39 +584,246 @@ Project-URL: Changelog, https://pyoz.dev/changelog
 Description-Content-Type: text/markdown
 
 {readme_content}"""
-        whl.writestr(f"{dist_info}/METADATA", metadata)
 
-        # WHEEL
-        wheel_meta = f"""Wheel-Version: 1.0
+    entry_points = """[console_scripts]
+pyoz = pyoz:main
+"""
+
+    entries = []
+    for module in PACKAGE_MODULES:
+        with open(os.path.join(PYPI_DIR, "pyoz", module), "rb") as f:
+            entries.append((f"pyoz/{module}", f.read()))
+    entries += [
+        (f"{dist_info}/METADATA", metadata.encode("utf-8")),
+        (f"{dist_info}/entry_points.txt", entry_points.encode("utf-8")),
+        (f"{dist_info}/top_level.txt", b"pyoz\n_pyoz\n"),
+    ]
+    return [
+        (name, data, f"{name},sha256={sha256_digest(data)},{len(data)}")
+        for name, data in entries
+    ]
+
+
+def build_wheel(
+    extension_path, ext, platform_tag, version, dist_dir, common_entries=None
+):
+    """Build a single platform-specific wheel containing the native extension.
+
+    Uses abi3 (Python Stable ABI) tags: cp38-abi3-{platform}
+    This means a single wheel works for Python 3.8, 3.9, 3.10, 3.11, 3.12, 3.13+
+
+    common_entries is the result of wheel_common_entries(version), computed
+    here when omitted.
+    """
+    wheel_name = f"pyoz-{version}-cp38-abi3-{platform_tag}.whl"
+    wheel_path = os.path.join(dist_dir, wheel_name)
+
+    dist_info = f"pyoz-{version}.dist-info"
+    if common_entries is None:
+        common_entries = wheel_common_entries(version)
+
+    wheel_meta = f"""Wheel-Version: 1.0
 Generator: pyoz-build
 Root-Is-Purelib: false
 Tag: cp38-abi3-{platform_tag}
 """
-        whl.writestr(f"{dist_info}/WHEEL", wheel_meta)
-
-        # entry_points.txt
-        entry_points = """[console_scripts]
-pyoz = pyoz:main
-"""
-        whl.writestr(f"{dist_info}/entry_points.txt", entry_points)
-
-        # top_level.txt
-        whl.writestr(f"{dist_info}/top_level.txt", "pyoz\n_pyoz\n")
+    wheel_meta_name = f"{dist_info}/WHEEL"
+    wheel_meta_data = wheel_meta.encode("utf-8")
+
+    # Every small member is assembled before the archive is opened, so the
+    # writes below are one sequential pass: small text members first, then
+    # the large extension, then RECORD.
+    entries = common_entries + [
+        (
+            wheel_meta_name,
+            wheel_meta_data,
+            f"{wheel_meta_name},sha256={sha256_digest(wheel_meta_data)},"
+            f"{len(wheel_meta_data)}",
+        )
+    ]
+
+    record_lines = []
+
+    with zipfile.ZipFile(
+        wheel_path, "w", zipfile.ZIP_DEFLATED, strict_timestamps=False
+    ) as whl:
+        # Hashes are computed from the bytes being written, so RECORD never
+        # has to read members back from the archive
+        for name, data, record_line in entries:
+            whl.writestr(_zip_info(name, TEXT_COMPRESSLEVEL), data)
+            record_lines.append(record_line)
+
+        # Add the native extension module. It is streamed from disk in chunks
+        # and hashed on the way through, so it is never held in memory whole.
+        # Giving zipfile its size up front lets it omit the ZIP64 extra
+        # field, which only files over 2 GiB need.
+        ext_target = f"_pyoz{ext}"
+        info = _zip_info(ext_target, EXTENSION_COMPRESSLEVEL, mode=0o755)
+        info.file_size = os.path.getsize(extension_path)
+        with open(extension_path, "rb") as src, whl.open(info, "w") as dst:
+            h, size = _copy_and_hash(src, dst)
+        record_lines.append(f"{ext_target},sha256={_encode_digest(h.digest())},{size}")
 
         # RECORD (must be last, lists all files with hashes)
-        record_lines = []
-        for item in whl.namelist():
-            data = whl.read(item)
-            digest = sha256_digest(data)
-            size = len(data)
-            record_lines.append(f"{item},sha256={digest},{size}")
         record_lines.append(f"{dist_info}/RECORD,,")
-        whl.writestr(f"{dist_info}/RECORD", "\n".join(record_lines) + "\n")
+        whl.writestr(
+            _zip_info(f"{dist_info}/RECORD", TEXT_COMPRESSLEVEL),
+            "\n".join(record_lines) + "\n",
+        )
 
     print(f"  Built: {wheel_name}")
     return wheel_path
 
 
+def target_prefix(zig_target):
+    """Install prefix for a cross-compiled target: zig-out/<target>/.
+
+    Each target gets its own prefix so concurrent builds never overwrite
+    each other's _pyoz.so.
+    """
+    return os.path.join(PYPI_DIR, "zig-out", zig_target)
+
+
+def _zig_version():
+    """Return `zig version`, or an empty string if zig can't be run."""
+    try:
+        result = subprocess.run(["zig", "version"], capture_output=True, text=True)
+    except OSError:
+        return ""
+    return result.stdout.strip()
+
+
+def _hash_path(h, path, base):
+    """Feed a file, or every file under a directory, into hash h.
+
+    Relative paths are hashed along with contents, in sorted order, so the
+    digest only depends on what is on disk. Missing paths are skipped.
+    """
+    if os.path.isfile(path):
+        rel_path = os.path.relpath(path, base).replace(os.sep, "/")
+        h.update(f"{rel_path}\0{_file_sha256(path)}\n".encode())
+        return
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for name in sorted(filenames):
+            _hash_path(h, os.path.join(dirpath, name), base)
+
+
+def build_cache_key(python_headers_dir):
+    """Content hash of everything a cross-compiled _pyoz depends on.
+
+    That is the zig version, this directory's build files and sources, the
+    PyOZ dependency they build against (the repository root, see
+    build.zig.zon) and the CPython headers.
+    """
+    root_dir = os.path.dirname(PYPI_DIR)
+    h = hashlib.sha256()
+    h.update(_zig_version().encode() + b"\0")
+    for path in (
+        os.path.join(PYPI_DIR, "build.zig"),
+        os.path.join(PYPI_DIR, "build.zig.zon"),
+        os.path.join(PYPI_DIR, "src"),
+        os.path.join(root_dir, "build.zig"),
+        os.path.join(root_dir, "build.zig.zon"),
+        os.path.join(root_dir, "src"),
+        python_headers_dir,
+    ):
+        _hash_path(h, path, root_dir)
+    return h.hexdigest()
+
+
+def _copy_extension(extension_path, src_prefix, dst_prefix):
+    """Copy an extension to the same lib/ or bin/ path under dst_prefix.
+
+    The copy is written under a temporary name and renamed into place, so a
+    concurrent reader never sees a partial file.
+    """
+    dest = os.path.join(dst_prefix, os.path.relpath(extension_path, src_prefix))
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp_path = f"{dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+    shutil.copy2(extension_path, tmp_path)
+    os.replace(tmp_path, dest)
+    return dest
+
+
+def build_target(zig_target, ext, cpu, python_headers_dir, cache_dir=None):
+    """Cross-compile the extension for one target and cpu into target_prefix().
+
+    zig's output goes to <prefix>/build.log so that several targets can be
+    built at the same time. With cache_dir, a previously built extension
+    stored under <cache_dir>/<target>/<cpu>/ is reused instead of running
+    zig, and a fresh build is stored there.
+    """
+    prefix = target_prefix(zig_target)
+    target_cache = cache_dir and os.path.join(cache_dir, zig_target, cpu)
+    if target_cache:
+        cached = find_extension(ext, target_cache)
+        if cached:
+            # Another run may prune this entry while it is being copied;
+            # building from source is always a valid fallback
+            try:
+                _copy_extension(cached, target_cache, prefix)
+            except OSError as e:
+                print(f"  Warning: could not use cached build for {zig_target}: {e}")
+            else:
+                print(f"  Using cached build for {zig_target}")
+                return True
+
+    if not zig_build(
+        target=zig_target,
+        release=True,
+        python_headers_dir=python_headers_dir,
+        prefix=prefix,
+        log_path=os.path.join(prefix, "build.log"),
+        cpu=cpu,
+    ):
+        return False
+
+    if target_cache:
+        extension_path = find_extension(ext, prefix)
+        if extension_path:
+            # The build itself succeeded; failing to cache it is not fatal
+            try:
+                _copy_extension(extension_path, prefix, target_cache)
+            except OSError as e:
+                print(f"  Warning: could not cache build for {zig_target}: {e}")
+    return True
+
+
+def prune_build_cache(keep_dir):
+    """Delete every cached build in BUILD_CACHE_DIR except keep_dir.
+
+    Each source change produces a new cache key, so without pruning the
+    cache would gain a full set of binaries per edit.
+    """
+    keep = os.path.basename(keep_dir)
+    try:
+        with os.scandir(BUILD_CACHE_DIR) as it:
+            stale = [
+                entry.path
+                for entry in it
+                if entry.name != keep and entry.is_dir(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def default_jobs(target_count):
+    """Number of targets to build at once when --jobs isn't given.
+
+    One per CPU, but never more than there are targets, and (with psutil
+    installed) no more than available memory allows at BUILD_MEMORY_PER_JOB
+    each, so small CI runners don't run out of memory.
+    """
+    jobs = min(target_count, os.cpu_count() or 1)
+    if _psutil is not None:
+        memory_jobs = _psutil.virtual_memory().available // BUILD_MEMORY_PER_JOB
+        jobs = min(jobs, max(1, memory_jobs))
+    return jobs
+
+
 def get_current_platform_info():
     """Get zig target, platform tag, and extension for the current platform."""
     system = plat.system().lower()
@@ -418,21 +855,64 @@ def main():
     parser.add_argument(
         "--current-only",
         action="store_true",
-        help="Build wheel for current platform only",
+        help="Build wheel for current platform only, tuned for this machine's CPU "
+        "(not for distribution)",
     )
     parser.add_argument(
         "--no-build",
         action="store_true",
-        help="Skip zig build, use existing extension in zig-out/lib/",
+        help="Skip zig build, use existing extension in zig-out/ "
+        "(zig-out/<target>/ when building all platforms)",
     )
     parser.add_argument(
         "--dist-dir",
-        default=os.path.join(os.path.dirname(__file__), "dist"),
+        default=os.path.join(PYPI_DIR, "dist"),
         help="Output directory for wheels",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always run zig build instead of reusing extensions cached in "
+        f"{BUILD_CACHE_DIR}",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of targets to build at once (default: one per CPU, "
+        "limited by available memory when psutil is installed)",
+    )
+    parser.add_argument(
+        "--targets",
+        help="Comma-separated zig targets to build instead of all of: "
+        + ", ".join(zig_target for zig_target, _, _, _ in TARGETS),
+    )
     args = parser.parse_args()
 
+    # Check SOURCE_DATE_EPOCH before building anything rather than failing
+    # on the first wheel
+    try:
+        zip_date_time()
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.current_only and (args.targets is not None or args.jobs is not None):
+        parser.error("--targets and --jobs cannot be used with --current-only")
+
+    targets = TARGETS
+    if args.targets is not None:
+        selected = [name.strip() for name in args.targets.split(",") if name.strip()]
+        if not selected:
+            parser.error("--targets needs at least one target")
+        unknown = sorted(set(selected) - {t[0] for t in TARGETS})
+        if unknown:
+            parser.error(f"unknown target(s): {', '.join(unknown)}")
+        targets = [t for t in TARGETS if t[0] in selected]
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     version = get_version()
+    common_entries = wheel_common_entries(version)
     dist_dir = args.dist_dir
     os.makedirs(dist_dir, exist_ok=True)
 
@@ -442,8 +922,7 @@ def main():
 
     # Download bundled CPython headers for all targets (Zig's sysroot doesn't
     # include the host Python's multiarch headers, so we always need these)
-    pypi_dir = os.path.dirname(os.path.abspath(__file__))
-    headers_dir = os.path.join(pypi_dir, "python-headers")
+    headers_dir = os.path.join(PYPI_DIR, "python-headers")
     if not args.current_only and not args.no_build:
         ensure_python_headers(headers_dir)
         print()
@@ -454,7 +933,9 @@ def main():
         zig_target, platform_tag, ext = get_current_platform_info()
 
         if not args.no_build:
-            if not zig_build(release=True):
+            # This wheel is only for this machine, so let zig use every
+            # instruction set extension the host CPU has
+            if not zig_build(release=True, cpu="native"):
                 sys.exit(1)
 
         extension_path = find_extension(ext)
@@ -463,26 +944,46 @@ def main():
             print("Run 'cd pypi && zig build -Doptimize=ReleaseFast' first.")
             sys.exit(1)
 
-        build_wheel(extension_path, ext, platform_tag, version, dist_dir)
+        build_wheel(
+            extension_path, ext, platform_tag, version, dist_dir, common_entries
+        )
         wheels_built += 1
     else:
-        for zig_target, platform_tag, ext in TARGETS:
-            if not args.no_build:
-                stage_pyconfig(headers_dir, zig_target)
-                if not zig_build(
-                    target=zig_target,
-                    release=True,
-                    python_headers_dir=headers_dir,
-                ):
-                    print(f"  Skipping {zig_target} (build failed)")
-                    continue
+        # The zig builds are independent subprocesses, so run several at once
+        # from a thread pool and overlap codegen/linking across targets.
+        # They share the headers directory read-only; each one picks its own
+        # pyconfig.h.
+        built = {}
+        if not args.no_build:
+            cache_dir = None
+            if not args.no_cache:
+                cache_dir = os.path.join(BUILD_CACHE_DIR, build_cache_key(headers_dir))
+            max_workers = args.jobs or default_jobs(len(targets))
+            with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+                futures = {
+                    zig_target: pool.submit(
+                        build_target, zig_target, ext, cpu, headers_dir, cache_dir
+                    )
+                    for zig_target, _, ext, cpu in targets
+                }
+            built = {target: future.result() for target, future in futures.items()}
+            if cache_dir and any(built.values()):
+                prune_build_cache(cache_dir)
+
+        # Packaging is cheap next to compiling, so wheels are written serially
+        for zig_target, platform_tag, ext, _ in targets:
+            if not args.no_build and not built[zig_target]:
+                print(f"  Skipping {zig_target} (build failed)")
+                continue
 
-            extension_path = find_extension(ext)
+            extension_path = find_extension(ext, target_prefix(zig_target))
             if not extension_path:
                 print(f"  Skipping {zig_target} (extension not found)")
                 continue
 
-            build_wheel(extension_path, ext, platform_tag, version, dist_dir)
+            build_wheel(
+                extension_path, ext, platform_tag, version, dist_dir, common_entries
+            )
             wheels_built += 1
 
     print()
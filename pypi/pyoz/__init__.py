@@ -3,20 +3,37 @@
 import shutil
 import sys
 
-from _pyoz import (
-    build,
-    develop,
-    init,
-    publish,
-    run_bench,
-    run_tests,
-    version,
+# The native _pyoz extension is imported by the commands that use it, so
+# that e.g. `pyoz build --help` doesn't pay for loading it. These names are
+# still available as pyoz.<name> through __getattr__ below.
+_NATIVE_API = (
+    "build",
+    "develop",
+    "init",
+    "publish",
+    "run_bench",
+    "run_tests",
+    "version",
 )
 
+# Result of looking up zig in PATH, cached by _check_zig()
+_zig_path = None
+
+
+def __getattr__(name):
+    if name in _NATIVE_API:
+        import _pyoz
+
+        return getattr(_pyoz, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def _check_zig():
     """Check that Zig is installed and available in PATH."""
-    if shutil.which("zig") is None:
+    global _zig_path
+    if _zig_path is None:
+        _zig_path = shutil.which("zig")
+    if _zig_path is None:
         print("Error: Zig compiler not found in PATH.")
         print()
         print("PyOZ requires Zig to build extensions. Install it from:")
@@ -30,6 +47,8 @@ def _check_zig():
 
 
 def _print_usage():
+    from _pyoz import version
+
     ver = version()
     print(f"""pyoz {ver} - Build and package Zig Python extensions
 
@@ -88,6 +107,8 @@ Options:
             name = arg
         i += 1
 
+    from _pyoz import init
+
     _check_zig()
     init(name, in_current_dir, local_pyoz_path, package_layout)
 
@@ -118,6 +139,8 @@ Options:
         elif arg == "--stubs":
             stubs = True
 
+    from _pyoz import build
+
     _check_zig()
     wheel_path = build(release, stubs)
     print(f"Wheel: {wheel_path}")
@@ -134,6 +157,8 @@ Options:
   -h, --help  Show this help message""")
             return
 
+    from _pyoz import develop
+
     _check_zig()
     develop()
 
@@ -154,6 +179,8 @@ Options:
         elif arg in ("-t", "--test"):
             test_pypi = True
 
+    from _pyoz import publish
+
     publish(test_pypi)
 
 
@@ -177,6 +204,8 @@ Options:
         elif arg in ("-v", "--verbose"):
             verbose = True
 
+    from _pyoz import run_tests
+
     _check_zig()
     run_tests(release, verbose)
 
@@ -193,10 +222,23 @@ Options:
   -h, --help  Show this help message""")
             return
 
+    from _pyoz import run_bench
+
     _check_zig()
     run_bench()
 
 
+# Subcommand name -> handler taking the remaining command-line arguments
+COMMANDS = {
+    "init": _cmd_init,
+    "build": _cmd_build,
+    "develop": _cmd_develop,
+    "publish": _cmd_publish,
+    "test": _cmd_test,
+    "bench": _cmd_bench,
+}
+
+
 def main():
     """Entry point for the pyoz CLI."""
     args = sys.argv[1:]
@@ -206,25 +248,15 @@ def main():
         return
 
     if args[0] in ("-V", "--version"):
+        from _pyoz import version
+
         print(f"pyoz {version()}")
         return
 
     cmd = args[0]
-    cmd_args = args[1:]
-
-    if cmd == "init":
-        _cmd_init(cmd_args)
-    elif cmd == "build":
-        _cmd_build(cmd_args)
-    elif cmd == "develop":
-        _cmd_develop(cmd_args)
-    elif cmd == "publish":
-        _cmd_publish(cmd_args)
-    elif cmd == "test":
-        _cmd_test(cmd_args)
-    elif cmd == "bench":
-        _cmd_bench(cmd_args)
-    else:
+    handler = COMMANDS.get(cmd)
+    if handler is None:
         print(f"Unknown command: {cmd}\n")
         _print_usage()
         sys.exit(1)
+    handler(args[1:])
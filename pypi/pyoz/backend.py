@@ -11,11 +11,24 @@ in your ``pyproject.toml``:
     build-backend = "pyoz.backend"
 """
 
+import functools
 import os
 import re
 import shutil
 import tarfile
 
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Build droppings that never belong in an sdist
+_SDIST_EXCLUDE_SUFFIXES = (".pyc", ".o")
+_SDIST_EXCLUDE_DIRS = ("__pycache__",)
+
 
 def get_requires_for_build_wheel(config_settings=None):
     return []
@@ -37,7 +50,16 @@ def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
     wheel_path = build(release, stubs)
     filename = os.path.basename(wheel_path)
     dest = os.path.join(wheel_directory, filename)
-    shutil.copy2(wheel_path, dest)
+    if os.path.exists(dest):
+        if os.path.samefile(wheel_path, dest):
+            return filename
+        os.remove(dest)
+    # A hard link costs nothing when both directories are on the same
+    # filesystem; otherwise copy the data (frontends don't need the metadata)
+    try:
+        os.link(wheel_path, dest)
+    except OSError:
+        shutil.copyfile(wheel_path, dest)
     return filename
 
 
@@ -48,20 +70,84 @@ def build_sdist(sdist_directory, config_settings=None):
     sdist_filename = f"{sdist_name}.tar.gz"
     sdist_path = os.path.join(sdist_directory, sdist_filename)
 
-    with tarfile.open(sdist_path, "w:gz") as tar:
-        for path in ["pyproject.toml", "build.zig", "build.zig.zon", "src"]:
+    # gzip level 1: several times faster than the default 9 for a slightly
+    # larger archive
+    with tarfile.open(sdist_path, "w:gz", compresslevel=1) as tar:
+        for path in ["pyproject.toml", "build.zig", "build.zig.zon"]:
             if os.path.exists(path):
-                tar.add(path, arcname=os.path.join(sdist_name, path))
+                tar.add(path, arcname=f"{sdist_name}/{path}")
+        if os.path.isdir("src"):
+            _add_tree(tar, "src", f"{sdist_name}/src")
     return sdist_filename
 
 
+def _sdist_excluded(name):
+    return name.endswith(_SDIST_EXCLUDE_SUFFIXES) or name in _SDIST_EXCLUDE_DIRS
+
+
+def _add_tree(tar, root, arcname):
+    """Add the directory root and everything below it to tar as arcname.
+
+    Walks with os.scandir, whose entries carry their stat results, and
+    builds each TarInfo from that instead of having TarFile.add() stat every
+    path again and look up owner names. Entries are sorted per directory so
+    the archive is reproducible. Anything other than a regular file or
+    directory (e.g. a symlink) still goes through TarFile.add().
+    """
+    tar.add(root, arcname=arcname, recursive=False)
+    stack = [(root, arcname)]
+    while stack:
+        dirpath, dir_arcname = stack.pop()
+        with os.scandir(dirpath) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        subdirs = []
+        for entry in entries:
+            if _sdist_excluded(entry.name):
+                continue
+            entry_arcname = f"{dir_arcname}/{entry.name}"
+            if entry.is_symlink():
+                tar.add(entry.path, arcname=entry_arcname, recursive=False)
+                continue
+            st = entry.stat()
+            info = tarfile.TarInfo(entry_arcname)
+            info.mode = st.st_mode & 0o7777
+            info.mtime = st.st_mtime
+            info.uid = st.st_uid
+            info.gid = st.st_gid
+            if entry.is_dir():
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+                subdirs.append((entry.path, entry_arcname))
+            elif entry.is_file():
+                info.size = st.st_size
+                with open(entry.path, "rb") as f:
+                    tar.addfile(info, f)
+            else:
+                tar.add(entry.path, arcname=entry_arcname, recursive=False)
+        stack.extend(reversed(subdirs))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_pyproject(path, mtime):
+    # mtime is only part of the cache key, so an edited file is re-parsed
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def _get_project_field(field):
+    path = os.path.abspath("pyproject.toml")
     try:
-        with open("pyproject.toml") as f:
-            for line in f:
-                m = re.match(rf'^{field}\s*=\s*"(.+)"', line)
-                if m:
-                    return m.group(1)
+        if tomllib is not None:
+            project = _parse_pyproject(path, os.path.getmtime(path)).get("project", {})
+            value = project.get(field)
+            if isinstance(value, str):
+                return value
+        else:
+            with open(path) as f:
+                for line in f:
+                    m = re.match(rf'^{field}\s*=\s*"(.+)"', line)
+                    if m:
+                        return m.group(1)
     except FileNotFoundError:
         pass
     return "unknown" if field == "name" else "0.0.0"